@@ -5,7 +5,11 @@ Enhanced GeoStudio integration using PyGeoStudio library for true headless opera
 """
 
 from typing import Tuple, Dict, List, Any
+import copy
+from functools import lru_cache
 import logging
+import os
+import tempfile
 from pathlib import Path
 import numpy as np
 
@@ -19,6 +23,42 @@ except ImportError:
 
 from slope_stability_automation import SlopeConfiguration, SlopeAnalysisResult
 
+# Scratch directory for solver input files (RAM-backed where available)
+_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@lru_cache(maxsize=256)
+def _slope_points(slope_angle: float, slope_height: float) -> Tuple[Tuple[float, float], ...]:
+    """Model slope point coordinates for a slope angle (degrees) and height (cached)"""
+    
+    slope_rad = np.radians(slope_angle)
+    slope_rise = slope_height
+    slope_run = slope_rise / np.tan(slope_rad)
+    
+    # Define key slope points
+    return (
+        # Slope toe
+        (0, 0),
+        
+        # Slope crest
+        (slope_run, slope_rise),
+        
+        # Extended crest (flat area)
+        (slope_run + 50, slope_rise),
+        
+        # Left boundary
+        (-100, 0),
+        
+        # Left bottom boundary
+        (-100, -slope_height),
+        
+        # Right bottom boundary
+        (slope_run + 150, -slope_height),
+        
+        # Right boundary
+        (slope_run + 150, 0),
+    )
+
 
 class PyGeoStudioAnalyzer:
     """
@@ -41,6 +81,17 @@ class PyGeoStudioAnalyzer:
         
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template GSZ file not found: {template_gsz_path}")
+        
+        # Parse the template once; each configuration works on its own copy.
+        # Not every model object survives deepcopy, so probe it up front and
+        # reload the template per analysis when it cannot be copied.
+        self._template_model = pgs.load_gsz(str(self.template_path))
+        try:
+            copy.deepcopy(self._template_model)
+            self._template_copyable = True
+        except Exception as e:
+            self.logger.warning(f"Template model cannot be copied, reloading per analysis: {e}")
+            self._template_copyable = False
     
     def analyze_slope_configuration(self, config: SlopeConfiguration) -> SlopeAnalysisResult:
         """
@@ -54,8 +105,11 @@ class PyGeoStudioAnalyzer:
         """
         
         try:
-            # Load the template GSZ file
-            model = pgs.load_gsz(str(self.template_path))
+            # Copy the pre-loaded template model, or reload it if it cannot be copied
+            if self._template_copyable:
+                model = copy.deepcopy(self._template_model)
+            else:
+                model = pgs.load_gsz(str(self.template_path))
             
             # Modify geometry based on configuration
             self._update_slope_geometry(model, config)
@@ -134,35 +188,8 @@ class PyGeoStudioAnalyzer:
             List of (x, y) coordinates
         """
         
-        slope_rad = np.radians(geometry.slope_angle)
-        slope_rise = geometry.slope_height
-        slope_run = slope_rise / np.tan(slope_rad)
-        
-        # Define key slope points
-        points = [
-            # Slope toe
-            (0, 0),
-            
-            # Slope crest
-            (slope_run, slope_rise),
-            
-            # Extended crest (flat area)
-            (slope_run + 50, slope_rise),
-            
-            # Left boundary
-            (-100, 0),
-            
-            # Left bottom boundary
-            (-100, -geometry.slope_height),
-            
-            # Right bottom boundary
-            (slope_run + 150, -geometry.slope_height),
-            
-            # Right boundary
-            (slope_run + 150, 0),
-        ]
-        
-        return points
+        # Depends only on angle and height, so repeated geometries in a sweep share one result
+        return list(_slope_points(geometry.slope_angle, geometry.slope_height))
     
     def _update_slope_regions(self, geometry: Any, config: SlopeConfiguration):
         """
@@ -225,22 +252,29 @@ class PyGeoStudioAnalyzer:
             Analysis results dictionary
         """
         
+        temp_file = None
+        
         try:
-            # Save modified model to temporary file
-            temp_file = f"temp_{config_id}.gsz"
+            # Save modified model to a temporary file for the solver; use the
+            # RAM-backed /dev/shm when present so the zip write stays in memory
+            fd, temp_file = tempfile.mkstemp(prefix=f"temp_{config_id}_", suffix=".gsz",
+                                             dir=_TEMP_DIR)
+            os.close(fd)
             model.save(temp_file)
             
             # Run analysis
             results = model.solve()
             
-            # Clean up temporary file
-            Path(temp_file).unlink(missing_ok=True)
-            
             return results
             
         except Exception as e:
             self.logger.error(f"Analysis execution failed: {e}")
             return {}
+        
+        finally:
+            # Clean up temporary file
+            if temp_file:
+                Path(temp_file).unlink(missing_ok=True)
     
     def _extract_factor_of_safety(self, results: Dict) -> Tuple[float, float]:
         """
@@ -4,11 +4,45 @@ Environment Setup Script
 Automatically installs required dependencies and checks system capabilities.
 """
 
+import importlib
+import io
+import json
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    # Optional faster JSON serializer - install with: pip install orjson
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Status lines are collected here and written out once per setup phase so
+# concurrent installers/probes never interleave partial lines on the console
+_buf = io.StringIO()
+_buf_lock = threading.Lock()
+
+
+def emit(msg=""):
+    """Queue a status line for the next flush_output() call"""
+    with _buf_lock:
+        _buf.write(f"{msg}\n")
+
+
+def flush_output():
+    """Write all queued status lines to stdout in one call"""
+    with _buf_lock:
+        sys.stdout.write(_buf.getvalue())
+        sys.stdout.flush()
+        _buf.seek(0)
+        _buf.truncate(0)
+
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -23,13 +57,17 @@ def check_python_version():
 def install_package(package_name, description=""):
     """Install a Python package with pip"""
     try:
-        print(f"📦 Installing {package_name}... {description}")
-        subprocess.run([sys.executable, "-m", "pip", "install", package_name], 
-                      check=True, capture_output=True)
-        print(f"✅ {package_name} installed successfully")
+        emit(f"📦 Installing {package_name}... {description}")
+        flush_output()  # Show the section header and start line before pip blocks
+        subprocess.run([sys.executable, "-m", "pip", "install", "--quiet", package_name],
+                      check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                      text=True)
+        emit(f"✅ {package_name} installed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package_name}: {e}")
+        emit(f"❌ Failed to install {package_name}: {e}")
+        if e.stderr:
+            emit(e.stderr.strip())
         return False
 
 
@@ -40,17 +78,17 @@ def check_package_availability(package_name, import_name=None):
     
     try:
         __import__(import_name)
-        print(f"✅ {package_name} is available")
+        emit(f"✅ {package_name} is available")
         return True
     except ImportError:
-        print(f"❌ {package_name} not available")
+        emit(f"❌ {package_name} not available")
         return False
 
 
 def install_core_dependencies():
     """Install core required dependencies"""
     
-    print("\n=== Installing Core Dependencies ===")
+    emit("\n=== Installing Core Dependencies ===")
     
     core_packages = [
         ("pandas", "Data manipulation and analysis"),
@@ -66,15 +104,17 @@ def install_core_dependencies():
     for package, description in core_packages:
         if install_package(package, description):
             success_count += 1
+        flush_output()
     
-    print(f"\n📊 Core Dependencies: {success_count}/{len(core_packages)} installed")
+    emit(f"\n📊 Core Dependencies: {success_count}/{len(core_packages)} installed")
+    flush_output()
     return success_count == len(core_packages)
 
 
 def install_enhanced_dependencies():
     """Install enhanced optional dependencies"""
     
-    print("\n=== Installing Enhanced Dependencies ===")
+    emit("\n=== Installing Enhanced Dependencies ===")
     
     enhanced_packages = [
         ("PyGeoStudio", "Direct GeoStudio .gsz file manipulation (HIGHLY RECOMMENDED)")
@@ -86,16 +126,18 @@ def install_enhanced_dependencies():
         if install_package(package, description):
             success_count += 1
         else:
-            print(f"⚠️  {package} installation failed - will use fallback methods")
+            emit(f"⚠️  {package} installation failed - will use fallback methods")
+        flush_output()
     
-    print(f"\n📊 Enhanced Dependencies: {success_count}/{len(enhanced_packages)} installed")
+    emit(f"\n📊 Enhanced Dependencies: {success_count}/{len(enhanced_packages)} installed")
+    flush_output()
     return success_count > 0
 
 
 def check_system_capabilities():
     """Check what analysis capabilities are available"""
     
-    print("\n=== System Capabilities Check ===")
+    emit("\n=== System Capabilities Check ===")
     
     capabilities = {
         "Excel Processing": False,
@@ -133,10 +175,11 @@ def check_system_capabilities():
             break
     
     # Print capabilities summary
-    print("\n📋 System Capabilities Summary:")
+    emit("\n📋 System Capabilities Summary:")
     for capability, available in capabilities.items():
         status = "✅" if available else "❌"
-        print(f"  {status} {capability}")
+        emit(f"  {status} {capability}")
+    flush_output()
     
     return capabilities
 
@@ -152,59 +195,84 @@ def create_config_file(capabilities):
     }
     
     config_file = Path("system_config.json")
+    tmp_file = config_file.with_name(config_file.name + ".tmp")
     
     try:
-        import json
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write to a temporary file and swap it in so an interrupted write
+        # never leaves a truncated config behind
+        if ORJSON_AVAILABLE:
+            tmp_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(config, f, indent=2)
+        os.replace(tmp_file, config_file)
         
-        print(f"\n💾 Configuration saved to {config_file}")
+        emit(f"\n💾 Configuration saved to {config_file}")
         return True
         
     except Exception as e:
-        print(f"❌ Failed to save configuration: {e}")
+        emit(f"❌ Failed to save configuration: {e}")
+        return False
+    
+    finally:
+        flush_output()
+
+
+def _try_import(module_name):
+    """Import a module, returning True if it is available"""
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
         return False
 
 
 def run_test_analysis():
     """Run a quick test to verify installation"""
     
-    print("\n=== Running Test Analysis ===")
+    emit("\n=== Running Test Analysis ===")
+    
+    # Independent module graphs - import them concurrently to overlap
+    # the C-extension initialization of the heavier libraries
+    modules = ["pandas", "numpy", "xlwings", "pygeostudio",
+               "matplotlib.pyplot", "seaborn"]
     
     try:
+        with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+            available = dict(zip(modules, pool.map(_try_import, modules)))
+        
         # Test basic imports
-        import pandas as pd
-        import numpy as np
-        print("✅ Core libraries imported successfully")
+        if not (available["pandas"] and available["numpy"]):
+            raise ImportError("pandas and numpy are required")
+        emit("✅ Core libraries imported successfully")
         
         # Test Excel capabilities
-        try:
-            import xlwings as xw
-            print("✅ Excel automation available")
-        except ImportError:
-            print("⚠️  Excel automation not available")
+        if available["xlwings"]:
+            emit("✅ Excel automation available")
+        else:
+            emit("⚠️  Excel automation not available")
         
         # Test PyGeoStudio
-        try:
-            import pygeostudio as pgs
-            print("✅ PyGeoStudio integration available")
-        except ImportError:
-            print("⚠️  PyGeoStudio not available - will use fallback methods")
+        if available["pygeostudio"]:
+            emit("✅ PyGeoStudio integration available")
+        else:
+            emit("⚠️  PyGeoStudio not available - will use fallback methods")
         
         # Test plotting
-        try:
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-            print("✅ Plotting capabilities available")
-        except ImportError:
-            print("⚠️  Plotting not available")
+        if available["matplotlib.pyplot"] and available["seaborn"]:
+            emit("✅ Plotting capabilities available")
+        else:
+            emit("⚠️  Plotting not available")
         
-        print("\n🎉 Basic system test completed successfully!")
+        emit("\n🎉 Basic system test completed successfully!")
         return True
         
     except Exception as e:
-        print(f"❌ System test failed: {e}")
+        emit(f"❌ System test failed: {e}")
         return False
+    
+    finally:
+        flush_output()
 
 
 def main():
@@ -5,26 +5,366 @@ Generates detailed visualization files showing slope geometry, soil strata,
 failure surfaces, and pipeline locations for engineering review.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Circle, Arc
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Mapping
+from types import MappingProxyType
+import io
 import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict
+from functools import lru_cache, wraps
+from operator import attrgetter
+
+try:
+    # Optional faster JSON serializer - install with: pip install orjson
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    # Optional binary geometry data output - install with: pip install msgpack
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
 
 from slope_stability_automation import SlopeConfiguration, SlopeGeometry, SoilLayer, SlopeAnalysisResult
 
+# matplotlib is imported on first use (see _load_matplotlib) so that importing this
+# module stays cheap for code paths that never plot
+matplotlib = None
+patches = None
+mpath = None
+PolyCollection = LineCollection = EllipseCollection = None
+to_rgba = None
+Figure = None
+FigureCanvasAgg = None
+
+
+# SoilLayer fields in record order, and the matching geometry data file keys
+_SOIL_LAYER_FIELDS = ('name', 'unit_weight', 'cohesion_total', 'cohesion_effective',
+                      'friction_angle', 'thickness')
+_SOIL_LAYER_DATA_KEYS = ('name', 'unit_weight_pcf', 'cohesion_total_psf', 'cohesion_effective_psf',
+                         'friction_angle_degrees', 'thickness_ft')
+_soil_layer_record = attrgetter(*_SOIL_LAYER_FIELDS)
+
+# Info box block for one layer: {0} is the layer number, {1}-{6} a soil layer record
+_SOIL_LAYER_TEMPLATE = ('Layer {0}: {1}\n'
+                        '  γ = {2:.0f} pcf\n'
+                        '  c = {4:.0f} psf\n'
+                        '  φ = {5:.0f}°\n'
+                        '  t = {6:.0f} ft\n')
+
+
+def _soil_layer_records(soil_layers: List[SoilLayer]) -> Tuple[tuple, ...]:
+    """Soil layers as hashable field tuples (see _SOIL_LAYER_FIELDS), read in one pass"""
+    return tuple(map(_soil_layer_record, soil_layers))
+
+
+@lru_cache(maxsize=128)
+def _soil_layer_text(layers: Tuple[tuple, ...]) -> str:
+    """
+    Soil layer information box text for _soil_layer_records() tuples - one block
+    per layer, blank line between layers
+    """
+    layer_blocks = [_SOIL_LAYER_TEMPLATE.format(i, *record)
+                    for i, record in enumerate(layers, 1)]
+    return ''.join([f'SOIL LAYERS ({len(layer_blocks)} layers)\n', '─' * 35 + '\n',
+                    '\n'.join(layer_blocks)])
+
+
+def _msgpack_default(obj):
+    """msgpack fallback encoder: NumPy values to native types, anything else to str"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _load_matplotlib():
+    """
+    Import matplotlib and bind the plotting names used here
+    
+    Figures are drawn on their own FigureCanvasAgg, so no backend is selected:
+    other pyplot users in the process keep whatever backend they chose.
+    """
+    global matplotlib, patches, mpath, PolyCollection, LineCollection, EllipseCollection
+    global to_rgba, Figure, FigureCanvasAgg
+    
+    if matplotlib is not None:
+        return
+    
+    import matplotlib as _matplotlib
+    import matplotlib.patches as _patches
+    import matplotlib.path as _mpath
+    from matplotlib.collections import PolyCollection as _PolyCollection
+    from matplotlib.collections import LineCollection as _LineCollection
+    from matplotlib.collections import EllipseCollection as _EllipseCollection
+    from matplotlib.colors import to_rgba as _to_rgba
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+    
+    patches, mpath = _patches, _mpath
+    PolyCollection, LineCollection, EllipseCollection = _PolyCollection, _LineCollection, _EllipseCollection
+    to_rgba, Figure, FigureCanvasAgg = _to_rgba, _Figure, _FigureCanvasAgg
+    matplotlib = _matplotlib  # Set last - marks the names above as loaded
+
+
+def _warm_font_cache():
+    """
+    Load matplotlib's font manager and resolve the fonts used for plot text.
+    
+    Done in the parent before a worker pool starts: forked workers inherit the
+    resolved fonts, and spawned workers find the font cache already on disk
+    instead of each rebuilding it.
+    """
+    _load_matplotlib()
+    from matplotlib import font_manager
+    for family in ('sans-serif', 'monospace'):
+        font_manager.findfont(font_manager.FontProperties(family=[family]))
+
+
+# rcParams applied while building and saving plots: no label uses $...$ math, so
+# skip the mathtext parser, and let Agg simplify paths more aggressively
+_PLOT_RC_PARAMS = {
+    'text.parse_math': False,
+    'path.simplify_threshold': 1.0,
+}
+
+
+def _with_plot_rc_params(method):
+    """Run a plotting method inside matplotlib.rc_context(_PLOT_RC_PARAMS)"""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        _load_matplotlib()
+        with matplotlib.rc_context(_PLOT_RC_PARAMS):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+@lru_cache(maxsize=256)
+def _slope_boundary_points(coords: Tuple[Tuple[float, float], ...]) -> np.ndarray:
+    """
+    Overall domain boundary for a set of geometry coordinates (cached per geometry)
+    
+    Returns a read-only (5, 2) array of (x, y) rows - bottom left, bottom right,
+    top right, top left and the closing bottom left point.
+    """
+    pts = np.asarray(coords, dtype=np.float64)
+    x_min, y_min = pts.min(axis=0)
+    x_max, y_max = pts.max(axis=0)
+    
+    # Create overall domain boundary (for reference)
+    boundary = np.array([
+        (x_min, y_min),  # Bottom left
+        (x_max, y_min),  # Bottom right
+        (x_max, y_max),  # Top right
+        (x_min, y_max),  # Top left
+        (x_min, y_min)   # Close polygon
+    ])
+    boundary.flags.writeable = False  # Shared through the cache
+    return boundary
+
+
+@lru_cache(maxsize=256)
+def _slope_bounds(coords: Tuple[Tuple[float, float], ...]) -> Tuple[float, float, float, float]:
+    """(x_min, x_max, y_min, y_max) extents of a set of geometry coordinates"""
+    boundary = _slope_boundary_points(coords)
+    (x_min, y_min), (x_max, y_max) = boundary[0], boundary[2]
+    return float(x_min), float(x_max), float(y_min), float(y_max)
+
+
+_point_record = attrgetter('id', 'x', 'y')
+
+
+def _geometry_point_records(geometry: SlopeGeometry) -> Tuple[Tuple[int, float, float], ...]:
+    """
+    Geometry points as hashable (id, x, y) tuples - the cache key for the
+    per-geometry helpers below. Built per call because points may be moved in place.
+    """
+    return tuple(map(_point_record, geometry.points))
+
+
+@lru_cache(maxsize=256)
+def _point_coords_by_id(points: Tuple[Tuple[int, float, float], ...]) -> Mapping[int, Tuple[float, float]]:
+    """Read-only point id -> (x, y) lookup for a set of (id, x, y) geometry points"""
+    return MappingProxyType({pt_id: (x, y) for pt_id, x, y in points})
+
+
+def _circle_arc(center_x: float, center_y: float, radius: float,
+                start_angle: float, end_angle: float, num_points: int) -> np.ndarray:
+    """(num_points, 2) array of points on a circle between two angles in radians"""
+    theta = np.linspace(start_angle, end_angle, num_points)
+    arc = np.empty((num_points, 2))
+    np.cos(theta, out=arc[:, 0])
+    np.sin(theta, out=arc[:, 1])
+    arc *= radius
+    arc += (center_x, center_y)
+    return arc
+
+
+# Region definitions from the GeoStudio template XML (region id -> point ids)
+_TEMPLATE_REGIONS = {
+    1: (5, 14, 15, 6),    # Foundation layer (deepest)
+    2: (2, 3, 7, 1),      # Slope material region
+    3: (8, 9, 7, 1, 4),   # Foundation around toe
+    4: (8, 9, 11, 10),    # Soil layer 1
+    5: (10, 11, 13, 12),  # Soil layer 2
+    6: (12, 13, 15, 14)   # Soil layer 3
+}
+
+# _TEMPLATE_REGIONS point ids as index arrays, and the largest id they use
+_TEMPLATE_REGION_IDS = {region_id: np.array(point_ids) for region_id, point_ids in _TEMPLATE_REGIONS.items()}
+_TEMPLATE_MAX_POINT_ID = max(max(point_ids) for point_ids in _TEMPLATE_REGIONS.values())
+
+
+@lru_cache(maxsize=256)
+def _template_region_coords(points: Tuple[Tuple[int, float, float], ...]) -> Dict[int, np.ndarray]:
+    """
+    Template material regions for a set of (id, x, y) geometry points (cached per geometry)
+    
+    Point coordinates are packed into a table indexed by point id (NaN rows for
+    missing ids) and each region is a read-only fancy-indexed slice of it with
+    the missing points dropped. Regions with fewer than three known points are omitted.
+    """
+    max_id = max(_TEMPLATE_MAX_POINT_ID, max((pt_id for pt_id, _, _ in points), default=0))
+    coords_by_id = np.full((max_id + 1, 2), np.nan)
+    for pt_id, x, y in points:
+        coords_by_id[pt_id] = (x, y)
+    
+    regions = {}
+    for region_id, point_ids in _TEMPLATE_REGION_IDS.items():
+        coords = coords_by_id[point_ids]
+        known = ~np.isnan(coords[:, 0])
+        if np.count_nonzero(known) >= 3:  # Need at least 3 points for a polygon
+            if not known.all():
+                coords = coords[known]
+            coords.flags.writeable = False  # Shared through the cache
+            regions[region_id] = coords
+    
+    return regions
+
+
+# Soil profile outline (point ids): ground surface from the left boundary over the
+# toe, crest and plateau, then down the right boundary and back along the base
+_SOIL_PROFILE_POINT_IDS = (4, 1, 2, 3, 6, 5)
+
+
+@lru_cache(maxsize=256)
+def _soil_profile_path(points: Tuple[Tuple[int, float, float], ...]) -> Optional['mpath.Path']:
+    """Closed outline of the soil mass for a set of (id, x, y) geometry points, if all are present"""
+    coords = _point_coords_by_id(points)
+    if not all(pt_id in coords for pt_id in _SOIL_PROFILE_POINT_IDS):
+        return None
+    
+    return mpath.Path([coords[pt_id] for pt_id in _SOIL_PROFILE_POINT_IDS], closed=True)
+
+
+def _longest_inside_run(arc: np.ndarray, inside: np.ndarray) -> np.ndarray:
+    """
+    Longest contiguous stretch of a closed circle's points flagged as inside
+    
+    The circle is first rotated to start at an outside point so that a run
+    crossing the 0/2*pi seam is not split in two.
+    """
+    shift = int(np.argmin(inside))  # First outside point
+    arc = np.roll(arc, -shift, axis=0)
+    inside = np.roll(inside, -shift)
+    
+    edges = np.diff(np.concatenate(([0], inside.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    longest = int(np.argmax(ends - starts))
+    return arc[starts[longest]:ends[longest]]
+
+
+@lru_cache(maxsize=256)
+def _material_region_layout(points: Tuple[Tuple[int, float, float], ...], layer_names: Tuple[str, ...]):
+    """
+    Drawing layout of the template material regions (cached per geometry and layer names)
+    
+    Returns (verts, facecolors, legend, labels) tuples: region vertex arrays with
+    their fill colors, one (color, name) legend entry per layer name (first
+    region wins), and (x, y, name) centroid labels for the slope and
+    foundation regions (2 and 3).
+    """
+    region_styles = SlopeGeometryVisualizer._REGION_STYLES
+    verts, facecolors, labels = [], [], []
+    legend = {}
+    
+    for region_id, coords in _template_region_coords(points).items():
+        if region_id in region_styles:
+            color, layer_idx = region_styles[region_id]
+            name = layer_names[layer_idx]
+            
+            verts.append(coords)
+            facecolors.append(color)
+            legend.setdefault(name, color)
+            
+            if region_id in (2, 3):  # Slope and foundation materials
+                centroid_x, centroid_y = coords.mean(axis=0)
+                labels.append((float(centroid_x), float(centroid_y), name))
+    
+    return (tuple(verts), tuple(facecolors),
+            tuple((color, name) for name, color in legend.items()), tuple(labels))
+
+
+@lru_cache(maxsize=256)
+def _slope_run_and_length(slope_angle: float, slope_height: float) -> Tuple[float, float]:
+    """Horizontal run and face length of a slope from its angle (degrees) and height"""
+    # NumPy rather than math.tan/math.hypot: those can differ in the last digit, which
+    # would change the slope_run written to existing geometry data files
+    slope_run = slope_height / np.tan(np.radians(slope_angle))
+    return slope_run, np.sqrt(slope_run**2 + slope_height**2)
+
 
 class SlopeGeometryVisualizer:
     """
     Visualizer for slope geometry, soil layers, failure surfaces, and pipeline locations
     """
     
-    def __init__(self, output_dir: str = "analysis_results"):
+    # Template region ID -> (fill color, soil layer index) for the 2-layer system
+    _REGION_STYLES = {
+        1: ('#8B4513', 1),  # Deep foundation
+        2: ('#D2691E', 0),  # Slope face material
+        3: ('#CD853F', 1),  # Around toe
+        4: ('#DEB887', 0),  # Upper soil
+        5: ('#BC8F8F', 1),  # Lower soil
+        6: ('#A0522D', 1),  # Deepest soil
+    }
+    
+    # Individual slope geometry plot layout in inches: fixed figure width and margins
+    # (title above, legend outside on the right, sized to the legend with some padding);
+    # the figure height follows the data aspect ratio, within limits, so the
+    # equal-aspect axes fill their box
+    _PLOT_LAYOUT = dict(width=16.0, left=0.96, legend_pad=0.24, bottom=0.72, top=0.96,
+                        min_height=6.0, max_height=12.0)
+    # Legend x anchor, in axes widths from the axes' left edge
+    _LEGEND_ANCHOR_X = 1.02
+    
+    # Normalized x positions of the groundwater symbols, scaled to each plot's extent
+    _GW_SYMBOL_TEMPLATE = np.linspace(0.0, 1.0, 8)
+    
+    def __init__(self, output_dir: str = "analysis_results", dpi: int = 150,
+                 binary_output: bool = False, pretty_json: bool = False,
+                 comparison_dpi: int = 150, consolidated_data: bool = False):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.dpi = dpi  # Resolution for individual slope geometry plots
+        self.comparison_dpi = comparison_dpi  # Resolution for the summary comparison grid
+        # Write geometry data as MessagePack (.msgpack) instead of JSON when msgpack is installed
+        self.binary_output = binary_output
+        # Indent JSON geometry data files for reading by eye (compact by default - smaller, faster)
+        self.pretty_json = pretty_json
+        # Batch runs write one geometry_data file for all configurations instead of one per plot
+        self.consolidated_data = consolidated_data
+        self._output_dir_ready = False  # Output directory is created on first save
         
         # Color schemes for different elements - 2-layer system
         self.soil_colors = {
@@ -44,6 +384,22 @@ class SlopeGeometryVisualizer:
         self.slip_surface_color = '#FF0000'  # Red
         self.groundwater_color = '#00CED1'   # Dark turquoise
         
+        # Background file writes of the current batch (config_id, what, future)
+        self._pending_writes = []
+        
+        # Figure reused by every individual slope plot (created on first use)
+        self._figure = None
+        self._axes = None
+    
+    def __getstate__(self):
+        """Pickle without the reusable figure or pending writes (worker processes make their own)"""
+        state = self.__dict__.copy()
+        state['_figure'] = None
+        state['_axes'] = None
+        state['_pending_writes'] = []
+        return state
+        
+    @_with_plot_rc_params
     def create_slope_geometry_plot(self, 
                                  config: SlopeConfiguration, 
                                  analysis_result: Optional[SlopeAnalysisResult] = None,
@@ -64,151 +420,192 @@ class SlopeGeometryVisualizer:
             Path to saved plot file
         """
         
-        fig, ax = plt.subplots(figsize=(16, 12))
+        fig, ax = self._plot_figure()
+        
+        return self._render_slope_geometry_plot(fig, ax, config, analysis_result,
+                                                pipe_diameter_in, pipe_depth_ft, pgd_path)
+    
+    def _plot_filepath(self, config_id: str) -> Path:
+        """Output path of the slope geometry plot for a configuration id"""
+        return self.output_dir / f"slope_geometry_{config_id}.png"
+    
+    def _ensure_output_dir(self):
+        """Create the output directory the first time anything is saved"""
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
+    
+    def _plot_figure(self):
+        """Return this visualizer's reusable slope plot figure with its axes cleared"""
+        if self._figure is None:
+            self._figure, self._axes = self._new_figure(figsize=(16, 12), dpi=self.dpi)
+        else:
+            self._axes.clear()
+        return self._figure, self._axes
+    
+    @staticmethod
+    def _new_figure(figsize: Tuple[float, float], dpi: int):
+        """
+        Create a figure and axes bound directly to an Agg canvas.
+        
+        The figure is not registered with pyplot, so it needs no plt.close()
+        and is released as soon as it goes out of scope. It is created at the
+        output dpi with the output face/edge colors so it can be written with
+        canvas.print_png() instead of savefig().
+        """
+        _load_matplotlib()
+        fig = Figure(figsize=figsize, dpi=dpi, facecolor='white', edgecolor='none')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        return fig, ax
+    
+    def _fit_figure_to_axes(self, fig, ax):
+        """
+        Size the figure so the equal-aspect axes fill the space inside the margins
         
-        # Calculate slope geometry points
-        slope_points = self._calculate_slope_boundary_points(config.geometry)
+        The right margin is measured from the legend, which is anchored just
+        outside the axes, so long material names are never cut off at the
+        figure edge.
+        """
+        layout = self._PLOT_LAYOUT
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        
+        width = layout['width']
+        # Legend size is set by its font sizes, so it does not change with the figure size
+        legend = ax.get_legend()
+        legend_width = 0.0
+        if legend is not None:
+            legend_width = legend.get_window_extent(fig.canvas.get_renderer()).width / fig.dpi
+        # The right margin holds the gap to the legend anchor, the legend and its padding
+        axes_width = ((width - layout['left'] - legend_width - layout['legend_pad'])
+                      / self._LEGEND_ANCHOR_X)
+        right = width - layout['left'] - axes_width
+        axes_height = axes_width * abs(y1 - y0) / abs(x1 - x0)
+        height = min(max(axes_height + layout['bottom'] + layout['top'], layout['min_height']),
+                     layout['max_height'])
+        
+        fig.set_size_inches(width, height)
+        fig.subplots_adjust(left=layout['left'] / width, right=1 - right / width,
+                            bottom=layout['bottom'] / height, top=1 - layout['top'] / height)
+    
+    def _render_slope_geometry_plot(self, fig, ax, config: SlopeConfiguration,
+                                    analysis_result: Optional[SlopeAnalysisResult],
+                                    pipe_diameter_in: float, pipe_depth_ft: float,
+                                    pgd_path: str, io_pool: Optional[ThreadPoolExecutor] = None,
+                                    write_data: bool = True) -> str:
+        """
+        Draw a slope geometry plot into an existing (empty) axes and save the figure
+        
+        If io_pool is given, the PNG is encoded in memory and it and the geometry
+        data file are written to disk on the pool, with the futures recorded in
+        self._pending_writes; otherwise both are written before returning.
+        write_data=False skips the data file.
+        """
+        
+        # Calculate slope geometry extents once for all plot helpers
+        bounds = self._calculate_slope_bounds(config.geometry)
         
         # Plot material regions
-        self._plot_material_regions(ax, config.geometry, config.soil_layers)
+        region_handles = self._plot_material_regions(ax, config.geometry, config.soil_layers)
         
         # Plot slope boundary
         self._plot_slope_boundary(ax, config.geometry)
         
         # Plot groundwater table
         if config.groundwater_depth > 0:
-            self._plot_groundwater_table(ax, slope_points, config.groundwater_depth)
+            self._plot_groundwater_table(ax, bounds, config.groundwater_depth)
         
         # Plot failure surface if available
-        if analysis_result and analysis_result.critical_slip_surface and analysis_result.critical_slip_surface is not True:
-            self._plot_failure_surface(ax, analysis_result.critical_slip_surface, slope_points)
+        slip_surface = getattr(analysis_result, 'critical_slip_surface', None)
+        if isinstance(slip_surface, dict) and slip_surface:
+            self._plot_failure_surface(ax, slip_surface, bounds, config.geometry)
         
         # Plot pipeline location
-        self._plot_pipeline(ax, slope_points, pipe_diameter_in, pipe_depth_ft, pgd_path)
+        self._plot_pipeline(ax, bounds, pipe_diameter_in, pipe_depth_ft, pgd_path)
         
         # Add dimensions and annotations
         self._add_dimensions_and_annotations(ax, config, analysis_result, pipe_diameter_in, pipe_depth_ft)
         
         # Format plot
-        self._format_plot(ax, config, analysis_result)
+        self._format_plot(ax, config, analysis_result, bounds, region_handles)
         
         # Save plot
-        filename = f"slope_geometry_{config.config_id}.png"
-        filepath = self.output_dir / filename
-        
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
+        self._ensure_output_dir()
+        filepath = self._plot_filepath(config.config_id)
+        
+        # Sizing the figure to the data avoids both the layout solver and the extra
+        # render pass bbox_inches='tight' needs; use a faster PNG compression level
+        # (line art compresses well anyway)
+        self._fit_figure_to_axes(fig, ax)
+        # The figure already has the output dpi and colors, so print_png skips
+        # savefig's per-call backend and kwarg resolution
+        if io_pool is not None:
+            # Encode now (the figure is reused for the next plot), write in the background
+            png_buffer = io.BytesIO()
+            fig.canvas.print_png(png_buffer, pil_kwargs={'compress_level': 3})
+            self._pending_writes.append((config.config_id, 'plot', io_pool.submit(
+                filepath.write_bytes, png_buffer.getvalue())))
+        else:
+            fig.canvas.print_png(filepath, pil_kwargs={'compress_level': 3})
         
         # Also create a detailed data file
-        self._create_geometry_data_file(config, analysis_result, pipe_diameter_in, pipe_depth_ft)
+        if write_data:
+            if io_pool is not None:
+                self._pending_writes.append((config.config_id, 'geometry data', io_pool.submit(
+                    self._create_geometry_data_file, config, analysis_result,
+                    pipe_diameter_in, pipe_depth_ft)))
+            else:
+                self._create_geometry_data_file(config, analysis_result, pipe_diameter_in, pipe_depth_ft)
         
         return str(filepath)
     
-    def _get_template_regions(self, geometry: SlopeGeometry) -> Dict[int, List[Tuple[float, float]]]:
-        """Get material regions from GeoStudio template structure"""
-        
-        # Create point lookup from geometry
-        points_dict = {point.id: (point.x, point.y) for point in geometry.points}
-        
-        # Define regions based on GeoStudio template structure
-        # Region definitions from template XML
-        template_regions = {
-            1: [5, 14, 15, 6],    # Foundation layer (deepest)
-            2: [2, 3, 7, 1],     # Slope material region  
-            3: [8, 9, 7, 1, 4],  # Foundation around toe
-            4: [8, 9, 11, 10],   # Soil layer 1
-            5: [10, 11, 13, 12], # Soil layer 2  
-            6: [12, 13, 15, 14]  # Soil layer 3
-        }
-        
-        # Convert point IDs to coordinates
-        regions = {}
-        for region_id, point_ids in template_regions.items():
-            region_coords = []
-            for pt_id in point_ids:
-                if pt_id in points_dict:
-                    region_coords.append(points_dict[pt_id])
-            if len(region_coords) >= 3:  # Need at least 3 points for a polygon
-                regions[region_id] = region_coords
-                
-        return regions
-    
-    def _calculate_slope_boundary_points(self, geometry: SlopeGeometry) -> List[Tuple[float, float]]:
+    def _calculate_slope_boundary_points(self, geometry: SlopeGeometry) -> np.ndarray:
         """Calculate overall domain boundary from template geometry"""
-        # Get all points and create overall boundary
-        all_x = [point.x for point in geometry.points]
-        all_y = [point.y for point in geometry.points]
-        
-        x_min, x_max = min(all_x), max(all_x)
-        y_min, y_max = min(all_y), max(all_y)
-        
-        # Create overall domain boundary (for reference)
-        boundary_points = [
-            (x_min, y_min),  # Bottom left
-            (x_max, y_min),  # Bottom right
-            (x_max, y_max),  # Top right
-            (x_min, y_max),  # Top left
-            (x_min, y_min)   # Close polygon
-        ]
-        
-        return boundary_points
-    
-    def _plot_material_regions(self, ax, geometry: SlopeGeometry, soil_layers: List[SoilLayer]):
-        """Plot material regions matching GeoStudio template structure"""
-        
-        # Get template regions
-        regions = self._get_template_regions(geometry)
-        
-        # Define region materials and colors based on 2-layer system
-        # Use actual soil layer names from configuration
-        layer_names = [layer.name for layer in soil_layers] if len(soil_layers) >= 2 else ['Slope Material', 'Foundation Material']
-        
-        region_materials = {
-            1: {'name': layer_names[1] if len(layer_names) > 1 else 'Foundation Material', 'color': '#8B4513', 'layer_idx': 1},  # Deep foundation
-            2: {'name': layer_names[0], 'color': '#D2691E', 'layer_idx': 0},   # Slope face material
-            3: {'name': layer_names[1] if len(layer_names) > 1 else 'Foundation Material', 'color': '#CD853F', 'layer_idx': 1}, # Around toe
-            4: {'name': layer_names[0], 'color': '#DEB887', 'layer_idx': 0},     # Upper soil
-            5: {'name': layer_names[1] if len(layer_names) > 1 else 'Foundation Material', 'color': '#BC8F8F', 'layer_idx': 1},     # Lower soil  
-            6: {'name': layer_names[1] if len(layer_names) > 1 else 'Foundation Material', 'color': '#A0522D', 'layer_idx': 1}      # Deepest soil
-        }
+        return _slope_boundary_points(tuple((point.x, point.y) for point in geometry.points))
+    
+    def _calculate_slope_bounds(self, geometry: SlopeGeometry) -> Tuple[float, float, float, float]:
+        """Calculate (x_min, x_max, y_min, y_max) of the template geometry"""
+        return _slope_bounds(tuple((point.x, point.y) for point in geometry.points))
+    
+    def _plot_material_regions(self, ax, geometry: SlopeGeometry, soil_layers: List[SoilLayer]) -> List['patches.Patch']:
+        """
+        Plot material regions matching GeoStudio template structure
         
-        # Plot each region
-        for region_id, coords in regions.items():
-            if region_id in region_materials:
-                material_info = region_materials[region_id]
-                layer_idx = material_info['layer_idx']
-                
-                # Get soil properties if available
-                if layer_idx < len(soil_layers):
-                    layer = soil_layers[layer_idx]
-                    label = f"{material_info['name']}\nγ={layer.unit_weight} pcf\nc={layer.cohesion_total} psf\nφ={layer.friction_angle}°"
-                else:
-                    label = material_info['name']
-                
-                # Create region polygon
-                region_polygon = patches.Polygon(coords, closed=True,
-                                                facecolor=material_info['color'], alpha=0.8,
-                                                edgecolor='black', linewidth=1.5,
-                                                label=material_info['name'])
-                ax.add_patch(region_polygon)
-                
-                # Add region label at centroid
-                if len(coords) >= 3:
-                    centroid_x = sum(p[0] for p in coords) / len(coords)
-                    centroid_y = sum(p[1] for p in coords) / len(coords)
-                    
-                    # Only add detailed labels for key regions
-                    if region_id in [2, 3]:  # Slope and foundation materials
-                        ax.text(centroid_x, centroid_y, material_info['name'],
-                               ha='center', va='center', fontsize=8, fontweight='bold',
-                               bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+        All regions are drawn as a single PolyCollection; the returned proxy
+        patches carry the per-region legend entries.
+        """
+        
+        # Use actual soil layer names from configuration (2-layer system)
+        layer_names = tuple(layer.name for layer in soil_layers) if len(soil_layers) >= 2 else ('Slope Material', 'Foundation Material')
+        
+        # Region vertices, colors, names and label positions are computed once per
+        # unique geometry/layer-name combination; only the artists are new per axes
+        verts, facecolors, legend, labels = _material_region_layout(
+            _geometry_point_records(geometry), layer_names)
+        
+        legend_handles = [patches.Patch(facecolor=color, alpha=0.8, edgecolor='black',
+                                        linewidth=1.5, label=name)
+                          for color, name in legend]
+        
+        # Add region labels at centroids of the key regions
+        for centroid_x, centroid_y, name in labels:
+            ax.text(centroid_x, centroid_y, name,
+                   ha='center', va='center', fontsize=8, fontweight='bold',
+                   bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+        
+        # Draw all region polygons in one batch
+        if verts:
+            ax.add_collection(PolyCollection(verts, closed=True, facecolors=facecolors,
+                                             edgecolors='black', linewidths=1.5, alpha=0.8,
+                                             rasterized=True))
+        
+        return legend_handles
     
     def _plot_slope_boundary(self, ax, geometry: SlopeGeometry):
         """Plot slope boundary lines from template geometry"""
         
         # Get key points from geometry
-        points_dict = {point.id: (point.x, point.y) for point in geometry.points}
+        points_dict = _point_coords_by_id(_geometry_point_records(geometry))
         
         # Draw main slope face (points 1 to 2)
         if 1 in points_dict and 2 in points_dict:
@@ -221,7 +618,7 @@ class SlopeGeometryVisualizer:
             # Calculate and display slope angle
             rise = crest[1] - toe[1]
             run = crest[0] - toe[0]
-            slope_angle = np.degrees(np.arctan(rise / run)) if run != 0 else 90
+            slope_angle = math.degrees(math.atan2(rise, run))
             
             # Add slope angle annotation
             mid_x = (toe[0] + crest[0]) / 2
@@ -247,15 +644,13 @@ class SlopeGeometryVisualizer:
                 ground_points.append(points_dict[pt_id])
         
         if len(ground_points) >= 2:
-            ground_x = [p[0] for p in ground_points]
-            ground_y = [p[1] for p in ground_points] 
-            ax.plot(ground_x, ground_y, 'k-', linewidth=2, alpha=0.8, label='Ground Surface', zorder=10)
+            ground = np.asarray(ground_points)
+            ax.plot(ground[:, 0], ground[:, 1], 'k-', linewidth=2, alpha=0.8, label='Ground Surface', zorder=10)
     
-    def _plot_groundwater_table(self, ax, slope_points: List[Tuple[float, float]], gw_depth: float):
+    def _plot_groundwater_table(self, ax, bounds: Tuple[float, float, float, float], gw_depth: float):
         """Plot groundwater table"""
         
-        x_coords = [p[0] for p in slope_points]
-        x_min, x_max = min(x_coords), max(x_coords)
+        x_min, x_max = bounds[0], bounds[1]
         
         gw_elevation = -gw_depth
         
@@ -264,12 +659,19 @@ class SlopeGeometryVisualizer:
                color=self.groundwater_color, linestyle='--', linewidth=2, 
                label=f'Groundwater Table (depth = {gw_depth} ft)')
         
-        # Add water symbols
-        for x in np.linspace(x_min + 20, x_max - 20, 8):
-            ax.plot(x, gw_elevation, 'o', color=self.groundwater_color, markersize=4, alpha=0.7)
+        # Add water symbols as a single marker collection
+        water_x = (x_min + 20) + (x_max - x_min - 40) * self._GW_SYMBOL_TEMPLATE
+        ax.scatter(water_x, np.full_like(water_x, gw_elevation), s=16,
+                   color=self.groundwater_color, alpha=0.7, zorder=2)
     
-    def _plot_failure_surface(self, ax, slip_surface: Dict[str, Any], slope_points: List[Tuple[float, float]]):
-        """Plot critical failure surface with enhanced visibility"""
+    def _plot_failure_surface(self, ax, slip_surface: Dict[str, Any], bounds: Tuple[float, float, float, float],
+                              geometry: Optional[SlopeGeometry] = None):
+        """
+        Plot critical failure surface with enhanced visibility
+        
+        Full slip circles are clipped to the soil profile of ``geometry`` when
+        it is given, otherwise to a padded box around ``bounds``.
+        """
         
         if not slip_surface:
             return
@@ -294,51 +696,49 @@ class SlopeGeometryVisualizer:
                     exit_angle += 360  # Handle angle wraparound
                 
                 # Create arc points from entry to exit angle
-                theta = np.linspace(np.radians(entry_angle), np.radians(exit_angle), 100)
-                circle_x = center_x + radius * np.cos(theta)
-                circle_y = center_y + radius * np.sin(theta)
+                arc = _circle_arc(center_x, center_y, radius,
+                                  math.radians(entry_angle), math.radians(exit_angle), 100)
                 
                 # Use all arc points (no clipping needed for geotechnically accurate arc)
-                valid_indices = list(range(len(circle_x)))
                 
             else:
                 # Fallback to full circle for backward compatibility
-                theta = np.linspace(0, 2*np.pi, 200)
-                circle_x = center_x + radius * np.cos(theta)
-                circle_y = center_y + radius * np.sin(theta)
-                
-                # Apply clipping for full circle
-                x_coords = [p[0] for p in slope_points]
-                y_coords = [p[1] for p in slope_points]
-                x_min, x_max = min(x_coords), max(x_coords)
-                y_min, y_max = min(y_coords), max(y_coords)
+                arc = _circle_arc(center_x, center_y, radius, 0, 2*np.pi, 200)
                 
-                valid_indices = []
-                for i, (x, y) in enumerate(zip(circle_x, circle_y)):
-                    if x_min-100 <= x <= x_max+100 and y >= y_min-50 and y <= y_max+100:
-                        valid_indices.append(i)
+                # Apply clipping for full circle - keep the arc through the soil mass
+                profile = None
+                if geometry is not None:
+                    profile = _soil_profile_path(_geometry_point_records(geometry))
                 
-                if not valid_indices:
-                    valid_indices = list(range(len(circle_x)))
+                if profile is not None:
+                    inside = profile.contains_points(arc)
+                    if inside.any() and not inside.all():
+                        arc = _longest_inside_run(arc, inside)
+                else:
+                    x_min, x_max, y_min, y_max = bounds
+                    circle_x, circle_y = arc[:, 0], arc[:, 1]
+                    
+                    mask = ((circle_x >= x_min - 100) & (circle_x <= x_max + 100) &
+                            (circle_y >= y_min - 50) & (circle_y <= y_max + 100))
+                    
+                    if mask.any():
+                        arc = arc[mask]
             
-            if valid_indices:
+            valid_x, valid_y = arc[:, 0], arc[:, 1]
+            
+            if valid_x.size:
                 # Plot the failure surface with enhanced styling
-                valid_x = [circle_x[i] for i in valid_indices]
-                valid_y = [circle_y[i] for i in valid_indices]
-                
                 # Draw failure surface with MAXIMUM visibility
-                # 1. Very thick bright red line that can't be missed
+                # 1. White background for contrast and yellow glow, stroked as one
+                #    collection (widest first so the glow sits on the white)
+                ax.add_collection(LineCollection([arc, arc], linewidths=[20, 15],
+                                                 colors=[to_rgba('white', 0.6), to_rgba('yellow', 0.4)],
+                                                 zorder=18, rasterized=True))
+                
+                # 2. Very thick bright red line that can't be missed
                 ax.plot(valid_x, valid_y, color='red', 
                        linewidth=10, linestyle='-', alpha=1.0,
-                       label='Critical Failure Surface', zorder=20)
-                
-                # 2. Add yellow glow/shadow for extreme visibility
-                ax.plot(valid_x, valid_y, color='yellow', 
-                       linewidth=15, linestyle='-', alpha=0.4, zorder=19)
-                
-                # 3. Add white background for contrast
-                ax.plot(valid_x, valid_y, color='white', 
-                       linewidth=20, linestyle='-', alpha=0.6, zorder=18)
+                       label='Critical Failure Surface', zorder=20, rasterized=True)
                 
                 # 4. VERY PROMINENT center point
                 ax.plot(center_x, center_y, 'o', color='yellow', 
@@ -374,8 +774,8 @@ class SlopeGeometryVisualizer:
                 
                 # 4. Enhanced radius annotation
                 # Find best point on arc for radius annotation
-                mid_idx = len(valid_indices) // 2
-                if mid_idx < len(valid_indices):
+                mid_idx = len(valid_x) // 2
+                if mid_idx < len(valid_x):
                     annotation_x = valid_x[mid_idx]
                     annotation_y = valid_y[mid_idx]
                     
@@ -399,7 +799,7 @@ class SlopeGeometryVisualizer:
                 
                 # 6. Add VERY PROMINENT "FAILURE SURFACE" label
                 # Position label at top of arc if possible
-                if valid_y:
+                if valid_y.size:
                     max_y_idx = np.argmax(valid_y)
                     label_x = valid_x[max_y_idx]
                     label_y = valid_y[max_y_idx]
@@ -421,10 +821,10 @@ class SlopeGeometryVisualizer:
         
         elif surface_type == 'coordinates' and slip_surface.get('coordinates'):
             # Plot failure surface from coordinates with enhanced styling
-            coords = slip_surface['coordinates']
-            if len(coords) > 1:
-                x_coords = [c[0] for c in coords]
-                y_coords = [c[1] for c in coords]
+            coords = np.asarray(slip_surface['coordinates'], dtype=float)
+            if coords.shape[0] > 1:
+                x_coords = coords[:, 0]
+                y_coords = coords[:, 1]
                 
                 # Enhanced coordinate-based failure surface
                 ax.plot(x_coords, y_coords, color=self.slip_surface_color, 
@@ -432,7 +832,7 @@ class SlopeGeometryVisualizer:
                 ax.plot(x_coords, y_coords, color=self.slip_surface_color, 
                        linewidth=8, alpha=0.3, zorder=14)  # Shadow effect
     
-    def _plot_pipeline(self, ax, slope_points: List[Tuple[float, float]], 
+    def _plot_pipeline(self, ax, bounds: Tuple[float, float, float, float], 
                       pipe_diameter_in: float, pipe_depth_ft: float, pgd_path: str = "perpendicular"):
         """Plot pipeline location and details with support for parallel and perpendicular orientations"""
         
@@ -441,29 +841,22 @@ class SlopeGeometryVisualizer:
         pipe_radius_ft = pipe_diameter_ft / 2.0
         
         # Determine pipeline location based on orientation
-        x_coords = [p[0] for p in slope_points]
-        y_coords = [p[1] for p in slope_points]
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        x_min, x_max, y_min, y_max = bounds
         
         if pgd_path.lower() == "parallel":
             # Pipeline follows the slope contour at specified depth below surface
-            # Extract slope geometry from slope_points to get actual slope angle
             toe_x, toe_y = 0, 0  # Slope toe at origin
             
-            # Find the slope crest point from slope_points
-            crest_x, crest_y = 0, 0
-            for x, y in slope_points:
-                if y > crest_y:  # Find highest point
-                    crest_x, crest_y = x, y
+            # Slope crest taken as the top right corner of the domain extents
+            crest_x, crest_y = (x_max, y_max) if y_max > 0 else (0, 0)
             
             # Create parallel pipeline that follows slope contour
-            slope_length = np.sqrt((crest_x - toe_x)**2 + (crest_y - toe_y)**2)
-            slope_angle_rad = np.arctan2(crest_y - toe_y, crest_x - toe_x)
+            slope_length = math.hypot(crest_x - toe_x, crest_y - toe_y)
+            slope_angle_rad = math.atan2(crest_y - toe_y, crest_x - toe_x)
             
             # Pipeline runs parallel to slope, offset by depth of cover
-            offset_x = pipe_depth_ft * np.sin(slope_angle_rad)  # Horizontal offset due to depth
-            offset_y = -pipe_depth_ft * np.cos(slope_angle_rad)  # Vertical offset due to depth
+            offset_x = pipe_depth_ft * math.sin(slope_angle_rad)  # Horizontal offset due to depth
+            offset_y = -pipe_depth_ft * math.cos(slope_angle_rad)  # Vertical offset due to depth
             
             # Start pipeline from a point partway up the slope
             start_fraction = 0.2  # Start 20% up the slope
@@ -481,15 +874,12 @@ class SlopeGeometryVisualizer:
             
             # Add pipeline circles at key locations along the slope
             num_circles = 3
+            pipe_circles = []
             for i in range(num_circles):
                 fraction = start_fraction + i * (end_fraction - start_fraction) / (num_circles - 1)
                 circle_x = toe_x + fraction * (crest_x - toe_x) + offset_x
                 circle_y = toe_y + fraction * (crest_y - toe_y) + offset_y
-                
-                pipe_circle = Circle((circle_x, circle_y), pipe_radius_ft,
-                                   facecolor=self.pipe_color, alpha=0.3,
-                                   edgecolor=self.pipe_color, linewidth=2)
-                ax.add_patch(pipe_circle)
+                pipe_circles.append((circle_x, circle_y))
                 
             # Pipeline centerline for annotations
             pipe_mid_x = (pipe_x_start + pipe_x_end) / 2
@@ -509,18 +899,22 @@ class SlopeGeometryVisualizer:
             
             # Add pipeline circles at key locations to show cross-section
             key_x_locations = [pipe_x_start + 20, 0, pipe_x_start + (pipe_x_end - pipe_x_start)*0.75]
-            
-            for x_loc in key_x_locations:
-                if pipe_x_start <= x_loc <= pipe_x_end:
-                    pipe_circle = Circle((x_loc, pipe_y), pipe_radius_ft,
-                                       facecolor=self.pipe_color, alpha=0.3,
-                                       edgecolor=self.pipe_color, linewidth=2)
-                    ax.add_patch(pipe_circle)
+            pipe_circles = [(x_loc, pipe_y)
+                            for x_loc in key_x_locations if pipe_x_start <= x_loc <= pipe_x_end]
                     
             # Pipeline centerline for annotations
             pipe_mid_x = (pipe_x_start + pipe_x_end) / 2
             pipe_mid_y = pipe_y
         
+        # Draw the pipe cross-section circles in one batch (one circle path, many offsets)
+        if pipe_circles:
+            ax.add_collection(EllipseCollection(widths=pipe_diameter_ft, heights=pipe_diameter_ft,
+                                                angles=0, units='xy', offsets=pipe_circles,
+                                                offset_transform=ax.transData,
+                                                facecolor=self.pipe_color, alpha=0.3,
+                                                edgecolor=self.pipe_color, linewidth=2,
+                                                rasterized=True))
+        
         # Add pipeline annotations (using calculated centerline coordinates)
         orientation_text = "Parallel" if pgd_path.lower() == "parallel" else "Perpendicular"
         ax.annotate(f'Pipeline ({orientation_text})\nOD = {pipe_diameter_in}"\nDOC = {pipe_depth_ft} ft',
@@ -554,8 +948,7 @@ class SlopeGeometryVisualizer:
         geometry = config.geometry
         
         # Slope height dimension
-        slope_rad = np.radians(geometry.slope_angle)
-        slope_run = geometry.slope_height / np.tan(slope_rad)
+        slope_run, slope_length = _slope_run_and_length(geometry.slope_angle, geometry.slope_height)
         
         # Height dimension line
         ax.annotate('', xy=(-120, 0), xytext=(-120, geometry.slope_height),
@@ -565,7 +958,6 @@ class SlopeGeometryVisualizer:
                bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen', alpha=0.7))
         
         # Slope length dimension
-        slope_length = np.sqrt(slope_run**2 + geometry.slope_height**2)
         mid_slope_x = slope_run / 2
         mid_slope_y = geometry.slope_height / 2
         
@@ -574,9 +966,16 @@ class SlopeGeometryVisualizer:
                bbox=dict(boxstyle="round,pad=0.2", facecolor='yellow', alpha=0.7))
     
     def _format_plot(self, ax, config: SlopeConfiguration, 
-                    analysis_result: Optional[SlopeAnalysisResult]):
+                    analysis_result: Optional[SlopeAnalysisResult],
+                    bounds: Optional[Tuple[float, float, float, float]] = None,
+                    region_handles: Optional[List['patches.Patch']] = None):
         """Format the plot with labels, title, legend and prominent Factor of Safety display"""
         
+        # Plot boundaries used for positioning and axis limits
+        if bounds is None:
+            bounds = self._calculate_slope_bounds(config.geometry)
+        x_min, x_max, y_min, y_max = bounds
+        
         # Set labels and title
         ax.set_xlabel('Distance (ft)', fontsize=12, fontweight='bold')
         ax.set_ylabel('Elevation (ft)', fontsize=12, fontweight='bold')
@@ -607,13 +1006,6 @@ class SlopeGeometryVisualizer:
                 fos_color = 'green'
                 fos_status = 'STABLE'
             
-            # Get plot boundaries for positioning
-            slope_points = self._calculate_slope_boundary_points(config.geometry)
-            x_coords = [p[0] for p in slope_points]
-            y_coords = [p[1] for p in slope_points]
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-            
             # Position Factor of Safety display in upper right
             fos_x = x_max - (x_max - x_min) * 0.25
             fos_y = y_max - (y_max - y_min) * 0.15
@@ -646,50 +1038,39 @@ class SlopeGeometryVisualizer:
         ax.set_axisbelow(True)
         
         # Add soil layer information box
-        self._add_soil_layer_info_box(ax, config)
-        
-        # Add legend with better positioning
-        legend = ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', 
+        self._add_soil_layer_info_box(ax, config, bounds)
+        
+        # Add legend with better positioning - material regions first, via proxies
+        handles, labels = ax.get_legend_handles_labels()
+        if region_handles:
+            handles = list(region_handles) + handles
+            labels = [h.get_label() for h in region_handles] + labels
+        legend = ax.legend(handles, labels, bbox_to_anchor=(self._LEGEND_ANCHOR_X, 1), loc='upper left', 
                           borderaxespad=0, fontsize=10)
         legend.get_frame().set_alpha(0.9)
         
         # Set reasonable axis limits with proper margins
-        slope_points = self._calculate_slope_boundary_points(config.geometry)
-        x_coords = [p[0] for p in slope_points]
-        y_coords = [p[1] for p in slope_points]
+        x_margin = (x_max - x_min) * 0.15
+        y_margin = (y_max - y_min) * 0.2
         
-        x_margin = (max(x_coords) - min(x_coords)) * 0.15
-        y_margin = (max(y_coords) - min(y_coords)) * 0.2
-        
-        ax.set_xlim(min(x_coords) - x_margin, max(x_coords) + x_margin)
-        ax.set_ylim(min(y_coords) - y_margin, max(y_coords) + y_margin)
+        ax.set_xlim(x_min - x_margin, x_max + x_margin)
+        ax.set_ylim(y_min - y_margin, y_max + y_margin)
     
-    def _add_soil_layer_info_box(self, ax, config: SlopeConfiguration):
+    def _add_soil_layer_info_box(self, ax, config: SlopeConfiguration,
+                                 bounds: Optional[Tuple[float, float, float, float]] = None):
         """Add detailed soil layer information box to the plot"""
         
         # Get plot boundaries for positioning
-        slope_points = self._calculate_slope_boundary_points(config.geometry)
-        x_coords = [p[0] for p in slope_points]
-        y_coords = [p[1] for p in slope_points]
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        if bounds is None:
+            bounds = self._calculate_slope_bounds(config.geometry)
+        x_min, x_max, y_min, y_max = bounds
         
         # Position soil info box in lower left
         soil_x = x_min + (x_max - x_min) * 0.02
         soil_y = y_min + (y_max - y_min) * 0.15
         
-        # Build soil layer information text
-        soil_text = f'SOIL LAYERS ({len(config.soil_layers)} layers)\n'
-        soil_text += '─' * 35 + '\n'
-        
-        for i, layer in enumerate(config.soil_layers, 1):
-            soil_text += f'Layer {i}: {layer.name}\n'
-            soil_text += f'  γ = {layer.unit_weight:.0f} pcf\n'
-            soil_text += f'  c = {layer.cohesion_effective:.0f} psf\n'
-            soil_text += f'  φ = {layer.friction_angle:.0f}°\n'
-            soil_text += f'  t = {layer.thickness:.0f} ft\n'
-            if i < len(config.soil_layers):
-                soil_text += '\n'
+        # Build soil layer information text (cached per unique layer stack)
+        soil_text = _soil_layer_text(_soil_layer_records(config.soil_layers))
         
         # Add soil layer information box
         ax.text(soil_x, soil_y, soil_text, 
@@ -703,11 +1084,17 @@ class SlopeGeometryVisualizer:
                                  pipe_diameter_in: float, pipe_depth_ft: float):
         """Create detailed geometry data file"""
         
+        geometry_data = self._geometry_data(config, analysis_result, pipe_diameter_in, pipe_depth_ft)
+        self._write_geometry_data(geometry_data, f"geometry_data_{config.config_id}")
+    
+    def _geometry_data(self, config: SlopeConfiguration,
+                       analysis_result: Optional[SlopeAnalysisResult],
+                       pipe_diameter_in: float, pipe_depth_ft: float) -> Dict[str, Any]:
+        """Detailed geometry data record for one configuration"""
+        
         # Calculate key geometric parameters
         geometry = config.geometry
-        slope_rad = np.radians(geometry.slope_angle)
-        slope_run = geometry.slope_height / np.tan(slope_rad)
-        slope_length = np.sqrt(slope_run**2 + geometry.slope_height**2)
+        slope_run, _ = _slope_run_and_length(geometry.slope_angle, geometry.slope_height)
         
         # Create comprehensive data structure
         geometry_data = {
@@ -720,16 +1107,8 @@ class SlopeGeometryVisualizer:
                 'bench_width_ft': 0,  # No benches in current coordinate system
                 'toe_distance_ft': 50  # Standard value
             },
-            'soil_layers': [
-                {
-                    'name': layer.name,
-                    'unit_weight_pcf': layer.unit_weight,
-                    'cohesion_total_psf': layer.cohesion_total,
-                    'cohesion_effective_psf': layer.cohesion_effective,
-                    'friction_angle_degrees': layer.friction_angle,
-                    'thickness_ft': layer.thickness
-                } for layer in config.soil_layers
-            ],
+            'soil_layers': [dict(zip(_SOIL_LAYER_DATA_KEYS, record))
+                            for record in _soil_layer_records(config.soil_layers)],
             'groundwater': {
                 'depth_below_surface_ft': config.groundwater_depth
             },
@@ -739,7 +1118,7 @@ class SlopeGeometryVisualizer:
                 'depth_of_cover_ft': pipe_depth_ft,
                 'centerline_elevation_ft': -(pipe_depth_ft + pipe_diameter_in/24.0)
             },
-            'boundary_points': self._calculate_slope_boundary_points(geometry)
+            'boundary_points': self._calculate_slope_boundary_points(geometry).tolist()
         }
         
         # Add analysis results if available
@@ -751,46 +1130,188 @@ class SlopeGeometryVisualizer:
                 'critical_slip_surface': analysis_result.critical_slip_surface
             }
         
-        # Save to JSON file
-        data_filename = f"geometry_data_{config.config_id}.json"
-        data_filepath = self.output_dir / data_filename
-        
-        with open(data_filepath, 'w') as f:
-            json.dump(geometry_data, f, indent=2, default=str)
+        return geometry_data
+    
+    def _write_geometry_data(self, geometry_data: Any, file_stem: str) -> Path:
+        """Save geometry data to MessagePack if requested and available, otherwise JSON"""
+        if self.binary_output and MSGPACK_AVAILABLE:
+            data_filepath = self.output_dir / f"{file_stem}.msgpack"
+            data_filepath.write_bytes(msgpack.packb(geometry_data, default=_msgpack_default,
+                                                    use_bin_type=True))
+            return data_filepath
+        
+        data_filepath = self.output_dir / f"{file_stem}.json"
+        
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if self.pretty_json:
+                option |= orjson.OPT_INDENT_2
+            data_filepath.write_bytes(orjson.dumps(geometry_data, default=str, option=option))
+        else:
+            with open(data_filepath, 'w') as f:
+                json.dump(geometry_data, f, indent=2 if self.pretty_json else None, default=str)
+        return data_filepath
     
     def create_multiple_slope_plots(self, 
                                   configurations: List[SlopeConfiguration],
                                   analysis_results: List[SlopeAnalysisResult] = None,
                                   pipe_diameter_in: float = 24.0,
                                   pipe_depth_ft: float = 4.0,
-                                  pgd_path: str = "perpendicular") -> List[str]:
+                                  pgd_path: str = "perpendicular",
+                                  max_workers: Optional[int] = None) -> List[str]:
         """
         Create slope geometry plots for multiple configurations
         
+        Configurations are split into chunks rendered in parallel worker
+        processes; each worker reuses a single figure for its chunk. All
+        configurations sharing a config_id go to the same chunk, so the last
+        one in the input is the one left on disk.
+        
+        Files are named by config_id, so a configuration (and result) that is the
+        same object as the previous one with that id is not rendered again - its
+        entry in the returned list points at the file already written.
+        
+        With consolidated_data set, the per-plot geometry data files are replaced
+        by a single geometry_data file mapping each config_id to its record.
+        
         Args:
             configurations: List of slope configurations
             analysis_results: List of corresponding analysis results
             pipe_diameter_in: Pipeline diameter
             pipe_depth_ft: Pipeline depth of cover
+            pgd_path: Pipeline orientation - "perpendicular" or "parallel" to slope
+            max_workers: Number of worker processes (defaults to CPU count, 1 = serial)
             
         Returns:
             List of file paths for generated plots
         """
         
-        created_files = []
+        results = [analysis_results[i] if analysis_results and i < len(analysis_results) else None
+                   for i in range(len(configurations))]
         
-        for i, config in enumerate(configurations):
-            result = analysis_results[i] if analysis_results and i < len(analysis_results) else None
-            
-            try:
-                filepath = self.create_slope_geometry_plot(config, result, pipe_diameter_in, pipe_depth_ft, pgd_path)
-                created_files.append(filepath)
-            except Exception as e:
-                print(f"Error creating plot for configuration {config.config_id}: {e}")
-                continue
+        created_files = self._render_plots(configurations, results, pipe_diameter_in,
+                                           pipe_depth_ft, pgd_path, max_workers)
+        if self.consolidated_data and created_files:
+            self._write_consolidated_geometry_data(configurations, results, created_files,
+                                                   pipe_diameter_in, pipe_depth_ft)
+        return created_files
+    
+    def _write_consolidated_geometry_data(self, configurations: List[SlopeConfiguration],
+                                          results: List[Optional[SlopeAnalysisResult]],
+                                          created_files: List[str],
+                                          pipe_diameter_in: float, pipe_depth_ft: float):
+        """Write one geometry data file for every configuration whose plot was created"""
+        rendered = set(created_files)
+        all_data = {config.config_id: self._geometry_data(config, result, pipe_diameter_in, pipe_depth_ft)
+                    for config, result in zip(configurations, results)
+                    if str(self._plot_filepath(config.config_id)) in rendered}
+        try:
+            self._write_geometry_data(all_data, "geometry_data")
+        except Exception as e:
+            print(f"Error writing consolidated geometry data: {e}")
+    
+    def _render_plots(self, configurations: List[SlopeConfiguration],
+                      results: List[Optional[SlopeAnalysisResult]],
+                      pipe_diameter_in: float, pipe_depth_ft: float,
+                      pgd_path: str, max_workers: Optional[int]) -> List[str]:
+        """Render configurations across worker processes (or serially for a single worker)"""
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(configurations))
+        write_data = not self.consolidated_data
+        if workers <= 1:
+            return [path for path in self._create_plots_serial(configurations, results, pipe_diameter_in,
+                                                               pipe_depth_ft, pgd_path, write_data) if path]
+        
+        # Group indices by config_id (each group in input order) so every write to a
+        # given file happens in one worker, then fill chunks of about equal size
+        groups = {}
+        for index, config in enumerate(configurations):
+            groups.setdefault(config.config_id, []).append(index)
+        chunk_size = -(-len(configurations) // workers)  # Ceiling division
+        chunks = [[]]
+        for indices in groups.values():
+            if len(chunks[-1]) >= chunk_size:
+                chunks.append([])
+            chunks[-1].extend(indices)
+        chunks = [sorted(chunk) for chunk in chunks]  # Input order within each chunk
+        
+        paths = [None] * len(configurations)
+        
+        try:
+            _warm_font_cache()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [(chunk, pool.submit(_render_plot_chunk, self,
+                                               [configurations[i] for i in chunk],
+                                               [results[i] for i in chunk],
+                                               pipe_diameter_in, pipe_depth_ft, pgd_path, write_data))
+                           for chunk in chunks]
+                
+                # Put each chunk's paths back at their input positions
+                for chunk, future in futures:
+                    for index, path in zip(chunk, future.result()):
+                        paths[index] = path
+        
+        except Exception as e:
+            print(f"Parallel plotting failed ({e}) - falling back to serial rendering")
+            paths = self._create_plots_serial(configurations, results,
+                                              pipe_diameter_in, pipe_depth_ft, pgd_path, write_data)
+        
+        return [path for path in paths if path]
+    
+    @_with_plot_rc_params
+    def _create_plots_serial(self, configurations: List[SlopeConfiguration],
+                             results: List[Optional[SlopeAnalysisResult]],
+                             pipe_diameter_in: float, pipe_depth_ft: float,
+                             pgd_path: str, write_data: bool = True) -> List[Optional[str]]:
+        """
+        Render configurations one after another in the current process
+        
+        Returns the plot path of each configuration, or None where it failed.
+        """
+        
+        created_files = []
+        self._pending_writes = []
+        # Last (configuration, result, path) rendered for each config_id
+        last_rendered = {}
+        
+        # Reuse the visualizer's figure for the whole batch, clearing the axes between plots.
+        # PNG and geometry data files are written on background threads so the disk I/O
+        # overlaps with drawing the next configuration; the pool is drained on exit.
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            for config, result in zip(configurations, results):
+                try:
+                    # The same objects repeated under one id would rewrite an identical file.
+                    # Compared by identity - slip surfaces may hold arrays, which == cannot reduce
+                    previous = last_rendered.get(config.config_id)
+                    if previous is not None and previous[0] is config and previous[1] is result:
+                        created_files.append(previous[2])
+                        continue
+                    
+                    fig, ax = self._plot_figure()
+                    filepath = self._render_slope_geometry_plot(fig, ax, config, result,
+                                                                pipe_diameter_in, pipe_depth_ft, pgd_path,
+                                                                io_pool=io_pool, write_data=write_data)
+                    last_rendered[config.config_id] = (config, result, filepath)
+                    created_files.append(filepath)
+                except Exception as e:
+                    print(f"Error creating plot for configuration {config.config_id}: {e}")
+                    created_files.append(None)
+        
+        failed_plots = set()
+        for config_id, what, future in self._pending_writes:
+            error = future.exception()
+            if error is not None:
+                print(f"Error writing {what} for configuration {config_id}: {error}")
+                if what == 'plot':
+                    failed_plots.add(str(self._plot_filepath(config_id)))
+        self._pending_writes = []
+        
+        if failed_plots:
+            created_files = [None if path in failed_plots else path for path in created_files]
         
         return created_files
     
+    @_with_plot_rc_params
     def create_summary_slope_comparison(self, 
                                       configurations: List[SlopeConfiguration],
                                       analysis_results: List[SlopeAnalysisResult] = None,
@@ -809,71 +1330,107 @@ class SlopeGeometryVisualizer:
         
         # Limit to most critical configurations
         if analysis_results:
+            # Pair configurations with results, ignoring any extras on either side
+            n = min(len(configurations), len(analysis_results))
+            configurations, analysis_results = configurations[:n], analysis_results[:n]
+            
             # Sort by Factor of Safety (ascending - most critical first)
-            paired = list(zip(configurations, analysis_results))
-            paired.sort(key=lambda x: x[1].effective_stress_fos)
-            configurations = [p[0] for p in paired[:max_plots]]
-            analysis_results = [p[1] for p in paired[:max_plots]]
+            fos = np.fromiter((r.effective_stress_fos for r in analysis_results),
+                              dtype=np.float64, count=n)
+            candidates = np.arange(len(fos))
+            if 0 < max_plots < len(fos):
+                # Partial selection: only the max_plots smallest values need ordering.
+                # Keep every value tied with the threshold so the stable sort below picks
+                # the same configurations a full sort would.
+                threshold = np.partition(fos, max_plots - 1)[max_plots - 1]
+                if not np.isnan(threshold):
+                    candidates = np.flatnonzero(fos <= threshold)
+            order = candidates[np.argsort(fos[candidates], kind='stable')][:max_plots]
+            configurations = [configurations[i] for i in order]
+            analysis_results = [analysis_results[i] for i in order]
         else:
             configurations = configurations[:max_plots]
         
-        # Create subplot grid
+        # Create subplot grid with fixed axes positions (no layout engine pass)
         rows = 2
         cols = 3
-        fig, axes = plt.subplots(rows, cols, figsize=(18, 12))
-        axes = axes.flatten()
-        
-        for i, config in enumerate(configurations):
-            if i >= max_plots:
-                break
-                
-            ax = axes[i]
-            result = analysis_results[i] if analysis_results else None
-            
-            # Calculate and plot slope profile  
-            slope_points = self._calculate_slope_boundary_points(config.geometry)
+        _load_matplotlib()
+        fig = Figure(figsize=(18, 12), dpi=self.comparison_dpi,
+                     facecolor='white', edgecolor='none')
+        FigureCanvasAgg(fig)
+        positions = [(0.05 + c * 0.32, 0.53 - r * 0.44, 0.27, 0.35)
+                     for r in range(rows) for c in range(cols)]
+        
+        # One shared figure-level legend (along the bottom edge) instead of per-subplot legends
+        legend_entries = {}
+        
+        # configurations was already limited to max_plots above; axes are created
+        # one per configuration, so no unused axes need hiding
+        results = analysis_results or [None] * len(configurations)
+        for rect, config, result in zip(positions, configurations, results):
+            ax = fig.add_axes(rect)
+            geometry = config.geometry
+            soil_layers = config.soil_layers
             
             # Plot material regions (simplified)
-            self._plot_material_regions(ax, config.geometry, config.soil_layers)
+            region_handles = self._plot_material_regions(ax, geometry, soil_layers)
             
             # Plot slope boundary
-            self._plot_slope_boundary(ax, config.geometry)
+            self._plot_slope_boundary(ax, geometry)
             
             # Plot failure surface if available
-            if result and result.critical_slip_surface and result.critical_slip_surface is not True:
-                self._plot_failure_surface(ax, result.critical_slip_surface, slope_points)
+            slip_surface = getattr(result, 'critical_slip_surface', None)
+            if isinstance(slip_surface, dict) and slip_surface:
+                # Slope extents are only needed to clip the failure surface
+                bounds = self._calculate_slope_bounds(geometry)
+                self._plot_failure_surface(ax, slip_surface, bounds, geometry)
             
             # Format individual subplot
             ax.set_aspect('equal')
             ax.grid(True, alpha=0.3)
             
-            title = f'{config.config_id}\n{config.geometry.slope_angle}° × {config.geometry.slope_height} ft'
-            title += f'\n{len(config.soil_layers)} Soil Layers'
+            title = (f'{config.config_id}\n{geometry.slope_angle}° × {geometry.slope_height} ft'
+                     f'\n{len(soil_layers)} Soil Layers')
             if result:
                 title += f' | FoS = {result.effective_stress_fos:.2f}'
             ax.set_title(title, fontsize=9)
             
             ax.set_xlabel('Distance (ft)', fontsize=8)
             ax.set_ylabel('Elevation (ft)', fontsize=8)
+            
+            # Collect legend entries, keeping the first handle for each label
+            handles, labels = ax.get_legend_handles_labels()
+            for handle in list(region_handles) + handles:
+                legend_entries.setdefault(handle.get_label(), handle)
         
-        # Hide unused subplots
-        for i in range(len(configurations), len(axes)):
-            axes[i].set_visible(False)
+        fig.suptitle('Critical Slope Configurations Comparison', fontsize=16, fontweight='bold', y=0.98)
         
-        plt.tight_layout()
-        plt.suptitle('Critical Slope Configurations Comparison', fontsize=16, fontweight='bold', y=0.98)
+        if legend_entries:
+            fig.legend(list(legend_entries.values()), list(legend_entries.keys()),
+                       loc='lower center', bbox_to_anchor=(0.5, 0.01),
+                       ncol=min(len(legend_entries), 6), fontsize=10)
         
         # Save comparison plot
+        self._ensure_output_dir()
         comparison_filename = "slope_configurations_comparison.png"
         comparison_filepath = self.output_dir / comparison_filename
         
-        plt.savefig(comparison_filepath, dpi=300, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        plt.close()
+        # Fixed layout - every element is placed inside the figure, so no bbox_inches='tight' pass
+        fig.canvas.print_png(comparison_filepath)
         
         return str(comparison_filepath)
 
 
+def _render_plot_chunk(visualizer: SlopeGeometryVisualizer,
+                       configurations: List[SlopeConfiguration],
+                       results: List[Optional[SlopeAnalysisResult]],
+                       pipe_diameter_in: float, pipe_depth_ft: float,
+                       pgd_path: str, write_data: bool = True) -> List[Optional[str]]:
+    """Process-pool worker: render a chunk of configurations with a pickled copy of the visualizer"""
+    return visualizer._create_plots_serial(configurations, results,
+                                           pipe_diameter_in, pipe_depth_ft, pgd_path, write_data)
+
+
 def main():
     """Test function for slope geometry visualization"""
     
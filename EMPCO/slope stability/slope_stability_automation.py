@@ -5,18 +5,29 @@ Automates GeoStudio SLOPE/W analysis for multiple slope configurations
 and integrates with soil springs analysis for decision matrix.
 """
 
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import json
+import math
+import copy
+
+try:
+    # Optional faster XML backend (libxml2) - install with: pip install lxml
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 
 @dataclass
 class GeometryPoint:
     """Defines a geometry point with coordinates and constraints"""
+    __slots__ = ('id', 'x', 'y', 'label', 'pinned')
+    
     id: int
     x: float  # feet
     y: float  # feet
@@ -26,14 +37,28 @@ class GeometryPoint:
 @dataclass
 class SlopeGeometry:
     """Defines slope geometry using coordinate points"""
+    __slots__ = ('points', '_toe', '_crest')
+    
     points: List[GeometryPoint]
     
+    def __post_init__(self):
+        # Toe (point 1) and crest (point 2) define the slope face. Only the point
+        # objects are kept - their coordinates may still be moved in place.
+        by_id = {p.id: p for p in reversed(self.points)}  # First point wins on repeated ids
+        self._toe = by_id.get(1)
+        self._crest = by_id.get(2)
+    
+    def _face_points(self) -> Tuple[GeometryPoint, GeometryPoint]:
+        """Toe and crest points of the slope face"""
+        if self._toe is None or self._crest is None:
+            raise ValueError("Slope geometry needs toe (1) and crest (2) points")
+        return self._toe, self._crest
+    
     @property
     def slope_angle(self) -> float:
         """Calculate slope angle from toe to crest points"""
         # Points 1 (0,0) and 2 (20,20) define the slope face
-        toe_point = next(p for p in self.points if p.id == 1)
-        crest_point = next(p for p in self.points if p.id == 2)
+        toe_point, crest_point = self._face_points()
         
         dx = crest_point.x - toe_point.x
         dy = crest_point.y - toe_point.y
@@ -41,51 +66,49 @@ class SlopeGeometry:
         if dx == 0:
             return 90.0
         
-        angle_rad = np.arctan(dy / dx)
-        return np.degrees(angle_rad)
+        return math.degrees(math.atan(dy / dx))
     
     @property 
     def slope_height(self) -> float:
         """Calculate slope height from toe to crest points"""
-        toe_point = next(p for p in self.points if p.id == 1)
-        crest_point = next(p for p in self.points if p.id == 2)
+        toe_point, crest_point = self._face_points()
         return crest_point.y - toe_point.y
     
     @property
     def slope_length(self) -> float:
         """Calculate horizontal slope length"""
-        toe_point = next(p for p in self.points if p.id == 1)
-        crest_point = next(p for p in self.points if p.id == 2)
+        toe_point, crest_point = self._face_points()
         dx = crest_point.x - toe_point.x
         dy = crest_point.y - toe_point.y
-        return np.sqrt(dx**2 + dy**2)
+        return math.sqrt(dx**2 + dy**2)
     
     @classmethod
     def create_standard_slope(cls, slope_angle: float, slope_height: float) -> 'SlopeGeometry':
         """Create standard slope geometry from angle and height with full template structure"""
         # Calculate slope length based on angle and height
         slope_length = slope_height / np.tan(np.radians(slope_angle))
+        right_x = slope_length + 180  # Right boundary, 180 ft of plateau past the crest
         
         # Create all 15 points needed for proper material regions (based on template structure)
         points = [
             # Main slope geometry points (1-7)
             GeometryPoint(1, 0, 0, "Point+Number", True),                        # Toe of slope
             GeometryPoint(2, slope_length, slope_height, "Point+Number", True),   # Top of slope face  
-            GeometryPoint(3, slope_length + 180, slope_height, "Point+Number", True), # Top of slope plateau
+            GeometryPoint(3, right_x, slope_height, "Point+Number", True),       # Top of slope plateau
             GeometryPoint(4, -100, 0, "Point+Number", True),                     # Left boundary
             GeometryPoint(5, -100, -100, "Point+Number", True),                  # Bottom left
-            GeometryPoint(6, slope_length + 180, -100, "Point+Number", True),    # Bottom right
-            GeometryPoint(7, slope_length + 180, 0, "Point+Number", False),      # Right boundary (not pinned)
+            GeometryPoint(6, right_x, -100, "Point+Number", True),               # Bottom right
+            GeometryPoint(7, right_x, 0, "Point+Number", False),                 # Right boundary (not pinned)
             
             # Additional points for soil layer boundaries (8-15) - needed for proper regions
             GeometryPoint(8, -100, -20, "Point+Number", True),                   # Left at -20 ft
-            GeometryPoint(9, slope_length + 180, -20, "Point+Number", True),     # Right at -20 ft
+            GeometryPoint(9, right_x, -20, "Point+Number", True),                # Right at -20 ft
             GeometryPoint(10, -100, -40, "Point+Number", True),                  # Left at -40 ft
-            GeometryPoint(11, slope_length + 180, -40, "Point+Number", True),    # Right at -40 ft
+            GeometryPoint(11, right_x, -40, "Point+Number", True),               # Right at -40 ft
             GeometryPoint(12, -100, -60, "Point+Number", True),                  # Left at -60 ft
-            GeometryPoint(13, slope_length + 180, -60, "Point+Number", True),    # Right at -60 ft
+            GeometryPoint(13, right_x, -60, "Point+Number", True),               # Right at -60 ft
             GeometryPoint(14, -100, -80, "Point+Number", True),                  # Left at -80 ft
-            GeometryPoint(15, slope_length + 180, -80, "Point+Number", True),    # Right at -80 ft
+            GeometryPoint(15, right_x, -80, "Point+Number", True),               # Right at -80 ft
         ]
         
         return cls(points=points)
@@ -118,6 +141,9 @@ class SlopeGeometry:
 @dataclass
 class SoilLayer:
     """Defines soil properties for each layer"""
+    __slots__ = ('name', 'unit_weight', 'cohesion_total', 'cohesion_effective',
+                 'friction_angle', 'thickness')
+    
     name: str
     unit_weight: float  # pcf
     cohesion_total: float  # psf (total stress)
@@ -129,6 +155,8 @@ class SoilLayer:
 @dataclass
 class SlopeConfiguration:
     """Complete slope configuration for analysis"""
+    __slots__ = ('config_id', 'geometry', 'soil_layers', 'groundwater_depth')
+    
     config_id: str
     geometry: SlopeGeometry
     soil_layers: List[SoilLayer]
@@ -138,16 +166,22 @@ class SlopeConfiguration:
 @dataclass
 class SlopeAnalysisResult:
     """Results from slope stability analysis"""
+    __slots__ = ('config_id', 'total_stress_fos', 'effective_stress_fos',
+                 'critical_slip_surface', 'requires_detailed_analysis')
+    
     config_id: str
     total_stress_fos: float  # Factor of Safety - Total Stress
     effective_stress_fos: float  # Factor of Safety - Effective Stress
-    critical_slip_surface: Dict[str, Any]  # Slip surface coordinates
+    critical_slip_surface: Optional[Dict[str, Any]]  # Slip surface coordinates
     requires_detailed_analysis: bool  # Based on FoS threshold
 
 
 class GeoStudioXMLHandler:
     """Handles GeoStudio XML template manipulation"""
     
+    # Parsed template roots by resolved path - parsed once, never modified
+    _TEMPLATE_CACHE: Dict[Path, ET.Element] = {}
+    
     def __init__(self, template_path: str):
         self.template_path = Path(template_path)
         self.tree = None
@@ -155,9 +189,34 @@ class GeoStudioXMLHandler:
         self.load_template()
     
     def load_template(self):
-        """Load the XML template"""
-        self.tree = ET.parse(self.template_path)
-        self.root = self.tree.getroot()
+        """Load a fresh, modifiable copy of the XML template"""
+        key = self.template_path.resolve()
+        template_root = self._TEMPLATE_CACHE.get(key)
+        if template_root is None:
+            template_root = ET.parse(self.template_path).getroot()
+            self._TEMPLATE_CACHE[key] = template_root
+        
+        self.root = copy.deepcopy(template_root)
+        self.tree = ET.ElementTree(self.root)
+        self._material_fields = self._index_material_fields(self.root)
+    
+    @staticmethod
+    def _index_material_fields(root) -> Dict[str, Dict[str, Any]]:
+        """Material ID -> {StressStrain tag: element} for the properties updated per soil layer"""
+        material_fields = {}
+        materials = root.find('Materials')
+        if materials is None:
+            return material_fields
+        
+        for material in materials.findall('Material'):
+            mat_id = material.findtext('ID')
+            stress_strain = material.find('StressStrain')
+            if mat_id is None or stress_strain is None or mat_id in material_fields:
+                continue  # First material wins for a repeated ID, as find() would
+            fields = {tag: stress_strain.find(tag) for tag in ('UnitWeight', 'CohesionPrime', 'PhiPrime')}
+            material_fields[mat_id] = {tag: elem for tag, elem in fields.items() if elem is not None}
+        
+        return material_fields
     
     def update_geometry(self, config: SlopeConfiguration) -> None:
         """Update geometry points based on slope configuration"""
@@ -167,25 +226,27 @@ class GeoStudioXMLHandler:
         # Calculate new point coordinates based on slope geometry
         slope_points = self._calculate_slope_points(config.geometry)
         
-        # Update existing points or add new ones
+        # Index the template's Point elements by ID once instead of one find() per point
+        # (reversed so the first element wins for a repeated ID, as find() would)
+        point_elems = {point.get('ID'): point for point in reversed(points.findall('Point'))}
+        
+        # Update existing points
         for i, (x, y) in enumerate(slope_points, 1):
-            point = points.find(f'Point[@ID="{i}"]')
+            point = point_elems.get(str(i))
             if point is not None:
                 point.set('X', str(x))
                 point.set('Y', str(y))
     
     def update_materials(self, soil_layers: List[SoilLayer]) -> None:
         """Update material properties for each soil layer"""
-        materials = self.root.find('Materials')
-        
         for i, layer in enumerate(soil_layers):
             # Update total stress material
-            total_mat = materials.find(f'Material[ID="{2*i+1}"]')
+            total_mat = self._material_fields.get(str(2*i+1))
             if total_mat is not None:
                 self._update_material_properties(total_mat, layer, stress_type='total')
             
             # Update effective stress material  
-            eff_mat = materials.find(f'Material[ID="{2*i+2}"]')
+            eff_mat = self._material_fields.get(str(2*i+2))
             if eff_mat is not None:
                 self._update_material_properties(eff_mat, layer, stress_type='effective')
     
@@ -194,27 +255,27 @@ class GeoStudioXMLHandler:
         # Convert GeometryPoint objects to coordinate tuples
         return [(point.x, point.y) for point in geometry.points]
     
-    def _update_material_properties(self, material_elem, layer: SoilLayer, stress_type: str):
-        """Update individual material properties"""
-        stress_strain = material_elem.find('StressStrain')
+    def _update_material_properties(self, material_fields: Dict[str, Any], layer: SoilLayer,
+                                    stress_type: str):
+        """Update individual material properties (elements from _index_material_fields)"""
         
         # Update unit weight
-        unit_weight_elem = stress_strain.find('UnitWeight')
+        unit_weight_elem = material_fields.get('UnitWeight')
         if unit_weight_elem is not None:
             unit_weight_elem.text = str(layer.unit_weight)
         
         if stress_type == 'total':
             # Update cohesion for total stress
-            cohesion_elem = stress_strain.find('CohesionPrime')
+            cohesion_elem = material_fields.get('CohesionPrime')
             if cohesion_elem is not None:
                 cohesion_elem.text = str(layer.cohesion_total)
         else:
             # Update effective stress parameters
-            cohesion_elem = stress_strain.find('CohesionPrime')
+            cohesion_elem = material_fields.get('CohesionPrime')
             if cohesion_elem is not None:
                 cohesion_elem.text = str(layer.cohesion_effective)
             
-            phi_elem = stress_strain.find('PhiPrime')
+            phi_elem = material_fields.get('PhiPrime')
             if phi_elem is not None:
                 phi_elem.text = str(layer.friction_angle)
     
@@ -298,7 +359,8 @@ class SlopeStabilityAnalyzer:
                 print(f"PyGeoStudio analysis failed for {config.config_id}: {e}, falling back to XML method")
         
         # Fallback to XML/CLI method
-        # Update XML template with configuration parameters
+        # Start from an unmodified template so no values carry over from the previous configuration
+        self.xml_handler.load_template()
         self.xml_handler.update_geometry(config)
         self.xml_handler.update_materials(config.soil_layers)
         
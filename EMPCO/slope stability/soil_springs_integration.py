@@ -236,17 +236,20 @@ class IntegratedAnalysisEngine:
         
         # If pipe depth is specified, determine which soil layer the pipe is in
         if pipe_depth_of_cover is not None:
-            current_depth = 0
-            for layer in slope_config.soil_layers:
-                # Check if pipe is within this layer
-                if current_depth <= pipe_depth_of_cover <= (current_depth + layer.thickness):
-                    return SoilSpringParameters(
-                        friction_angle=layer.friction_angle,
-                        cohesion=layer.cohesion_effective,
-                        unit_weight=layer.unit_weight,
-                        soil_type=f"{layer.name} (at {pipe_depth_of_cover} ft depth)"
-                    )
-                current_depth += layer.thickness
+            # Layer bottom depths; the first bottom at or below the pipe is its layer
+            thickness = np.fromiter((layer.thickness for layer in slope_config.soil_layers),
+                                    dtype=np.float64, count=len(slope_config.soil_layers))
+            bottoms = np.cumsum(thickness)
+            layer_idx = int(np.searchsorted(bottoms, pipe_depth_of_cover, side='left'))
+            
+            if pipe_depth_of_cover >= 0 and layer_idx < len(bottoms):
+                layer = slope_config.soil_layers[layer_idx]
+                return SoilSpringParameters(
+                    friction_angle=layer.friction_angle,
+                    cohesion=layer.cohesion_effective,
+                    unit_weight=layer.unit_weight,
+                    soil_type=f"{layer.name} (at {pipe_depth_of_cover} ft depth)"
+                )
             
             # If pipe is deeper than all defined layers, use the deepest layer
             deepest_layer = slope_config.soil_layers[-1]